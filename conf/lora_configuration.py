@@ -1,9 +1,22 @@
-LORA_CONFIGURATION: dict = {
-    "region": "EU868",
-    "mode": "LORA",
-    "frequency": 868100000,
-    "transmit_power": 14,
-    "bandwidth": 125000,
-    "spreading_factor": 9,
-    "data_rate": 5
-}
+from collections import namedtuple
+
+
+LoraConfig = namedtuple('LoraConfig', (
+    'region',
+    'mode',
+    'frequency',
+    'transmit_power',
+    'bandwidth',
+    'spreading_factor',
+    'data_rate'
+))
+
+LORA_CONFIGURATION: LoraConfig = LoraConfig(
+    region="EU868",
+    mode="LORA",
+    frequency=868100000,
+    transmit_power=14,
+    bandwidth=125000,
+    spreading_factor=9,
+    data_rate=5
+)
@@ -1,9 +1,28 @@
-from time import sleep
+import asyncio
+from machine import UART
 from lib.uart_module_driver import NodeModuleDriver
 from conf.uart_configuration import UART_CONFIGURATION
 from conf.lora_configuration import LORA_CONFIGURATION
 
 
+async def receive_loop(lora):
+    rx_flag = asyncio.ThreadSafeFlag()
+    lora.uart.irq(handler=lambda _: rx_flag.set(), trigger=UART.IRQ_RXIDLE)
+
+    while True:
+        response = lora.receive_data()
+
+        if response:
+            print(f"Received payload: {response}")
+
+        rx_flag.clear()
+
+        try:
+            await asyncio.wait_for_ms(rx_flag.wait(), 25)
+        except asyncio.TimeoutError:
+            pass
+
+
 if __name__ == '__main__':
     lora = NodeModuleDriver(device_id=UART_CONFIGURATION['uart_receive_id'],
                             uart_instance=UART_CONFIGURATION['uart_instance'],
@@ -12,22 +31,17 @@ if __name__ == '__main__':
 
     # lora.test_device()
     lora.reset_device()
-    sleep(2)
+    lora.wait_ready()
 
     lora.enable_receive_mode()
 
-    lora.set_region(LORA_CONFIGURATION['region'])
-    lora.set_lora_mode(LORA_CONFIGURATION['mode'])
-    lora.set_frequency(LORA_CONFIGURATION['frequency'])
-    lora.set_transmit_power(LORA_CONFIGURATION['transmit_power'])
-    lora.set_bandwidth(LORA_CONFIGURATION['bandwidth'])
-    lora.set_spreading_factor(LORA_CONFIGURATION['spreading_factor'])
+    lora.set_region(LORA_CONFIGURATION.region)
+    lora.set_lora_mode(LORA_CONFIGURATION.mode)
+    lora.set_frequency(LORA_CONFIGURATION.frequency)
+    lora.set_transmit_power(LORA_CONFIGURATION.transmit_power)
+    lora.set_bandwidth(LORA_CONFIGURATION.bandwidth)
+    lora.set_spreading_factor(LORA_CONFIGURATION.spreading_factor)
 
     lora.start_device()
 
-    while True:
-        response = lora.receive_data()
-
-        if response:
-            print(f"Received payload: {response}")
-            sleep(0.025)
+    asyncio.run(receive_loop(lora))
@@ -1,4 +1,4 @@
-from time import sleep
+from time import sleep_ms, ticks_add, ticks_diff, ticks_ms
 from lib.uart_module_driver import NodeModuleDriver
 from conf.uart_configuration import UART_CONFIGURATION
 from conf.lora_configuration import LORA_CONFIGURATION
@@ -12,19 +12,22 @@ if __name__ == '__main__':
 
     # lora.test_device()
     lora.reset_device()
-    sleep(2)
+    lora.wait_ready()
 
-    lora.set_region(LORA_CONFIGURATION['region'])
-    lora.set_lora_mode(LORA_CONFIGURATION['mode'])
-    lora.set_frequency(LORA_CONFIGURATION['frequency'])
-    lora.set_transmit_power(LORA_CONFIGURATION['transmit_power'])
-    lora.set_bandwidth(LORA_CONFIGURATION['bandwidth'])
-    lora.set_spreading_factor(LORA_CONFIGURATION['spreading_factor'])
+    lora.set_region(LORA_CONFIGURATION.region)
+    lora.set_lora_mode(LORA_CONFIGURATION.mode)
+    lora.set_frequency(LORA_CONFIGURATION.frequency)
+    lora.set_transmit_power(LORA_CONFIGURATION.transmit_power)
+    lora.set_bandwidth(LORA_CONFIGURATION.bandwidth)
+    lora.set_spreading_factor(LORA_CONFIGURATION.spreading_factor)
 
     lora.start_device()
 
+    next_send = ticks_ms()
+
     for i in range(5):
-        sleep(5)
+        next_send = ticks_add(next_send, 5000)
+        sleep_ms(max(0, ticks_diff(next_send, ticks_ms())))
         msg = f'Hello ({i})'
 
         print(f'Sending payload: {msg}')
@@ -0,0 +1,156 @@
+from asyncio import Event, Queue, create_task, get_running_loop, run, to_thread, wait_for
+from io import UnsupportedOperation
+from logging import getLogger
+from collections.abc import Callable
+from lib.serial_module_driver import NodeModuleDriver
+from conf.serial_configuration import SERIAL_CONFIGURATION
+from conf.lora_configuration import LORA_CONFIGURATION
+
+
+logger = getLogger(__name__)
+
+RECV_INTERVAL: float = 0.025
+
+
+def configure_lora_device(lora_device: NodeModuleDriver,
+                          device_id: int,
+                          receive_mode: bool = False,
+                          verbose: bool = False) -> None:
+    """
+    Configures the provided LoRa device with predefined settings necessary for
+    its operation.
+
+    :param lora_device: An instance of NodeModuleDriver.
+    :type lora_device: NodeModuleDriver
+    :param device_id: The ID of the device, shown in the verbose output.
+    :type device_id: int
+    :param receive_mode: Whether to enable the receive mode of the device.
+    :type receive_mode: bool
+    :param verbose: Whether to print the configuration read back from the device.
+    :type verbose: bool
+    :return: None
+    """
+    logger.debug('Configuring LoRa device...')
+    lora_device.reset_device()
+    lora_device.wait_ready()
+
+    if receive_mode:
+        lora_device.enable_receive_mode()
+
+    lora_device.configure(region=LORA_CONFIGURATION.region,
+                          mode=LORA_CONFIGURATION.mode,
+                          frequency=LORA_CONFIGURATION.frequency,
+                          transmit_power=LORA_CONFIGURATION.transmit_power,
+                          bandwidth=LORA_CONFIGURATION.bandwidth,
+                          spreading_factor=LORA_CONFIGURATION.spreading_factor)
+
+    if verbose:
+        status = lora_device.get_all_status()
+        rows = (('Device ID:', device_id),
+                ('Region:', status['region']),
+                ('LoRa mode:', status['lora_mode']),
+                ('Frequency:', status['frequency']),
+                ('Transmit Power:', status['transmit_power']),
+                ('Bandwidth:', status['bandwidth']),
+                ('Spreading factor:', status['spreading_factor']))
+
+        print("\n=== LoRa Device P2P Configuration ===\n"
+              + "\n".join(f"{label:18} {value}" for label, value in rows)
+              + "\n" + "=" * 35 + "\n")
+
+
+async def dispatch_loop(queue: Queue, callback: Callable[[bytes], None]) -> None:
+    """
+    Passes the payloads collected by the receive loop to the callback function, one at a time.
+
+    :param queue: The queue filled by the receive loop.
+    :type queue: Queue
+    :param callback: The callback function to process received data.
+    :type callback: Callable[[bytes], None]
+    :return: None
+    """
+    while True:
+        data = await queue.get()
+
+        try:
+            callback(data)
+        except Exception as ex:
+            logger.error("Callback error: %s", ex)
+
+
+async def receive_loop(lora_device: NodeModuleDriver, callback: Callable[[bytes], None]) -> None:
+    """
+    Receives data continuously from a LoRa device and processes it using a callback function.
+    The device is queried in a worker thread while the callback runs on the event loop, so a
+    slow callback does not delay the next query. Between two queries the loop waits on the
+    serial port, so it wakes up as soon as the device reports new data. Where the port cannot
+    be watched by the event loop, e.g. on Windows, it waits RECV_INTERVAL seconds instead.
+
+    :param lora_device: The LoRa device instance to receive data from.
+    :type lora_device: NodeModuleDriver
+    :param callback: The callback function to process received data.
+    :type callback: Callable[[bytes], None]
+    :return: None
+    """
+    loop = get_running_loop()
+    readable = Event()
+    queue: Queue[bytes] = Queue()
+    dispatcher = create_task(dispatch_loop(queue, callback))
+
+    try:
+        fd = lora_device.fileno()
+        loop.add_reader(fd, readable.set)
+        watched = True
+    except (OSError, NotImplementedError, UnsupportedOperation) as ex:
+        watched = False
+        logger.debug("Serial port not watchable, polling instead: %s", ex)
+
+    try:
+        while True:
+            try:
+                _, payload = await to_thread(lora_device.receive_into)
+
+                if payload:
+                    queue.put_nowait(bytes(payload))
+            except Exception as ex:
+                logger.error("Receive error: %s", ex)
+
+            readable.clear()
+
+            try:
+                await wait_for(readable.wait(), timeout=RECV_INTERVAL)
+            except TimeoutError:
+                pass
+    finally:
+        if watched:
+            loop.remove_reader(fd)
+
+        dispatcher.cancel()
+
+
+def main(callback: Callable[[bytes], None], verbose: bool = False) -> None:
+    """
+    Opens the receiving LoRa device from the serial configuration, configures it and
+    passes every received payload to the callback function until interrupted.
+
+    :param callback: The callback function to process received data.
+    :type callback: Callable[[bytes], None]
+    :param verbose: Whether to print the configuration read back from the device.
+    :type verbose: bool
+    :return: None
+    """
+    try:
+        with NodeModuleDriver(device_id=SERIAL_CONFIGURATION['serial_receive_id'],
+                              port=SERIAL_CONFIGURATION['serial_receive_port'],
+                              baudrate=SERIAL_CONFIGURATION['baudrate']) as lora:
+
+            configure_lora_device(lora,
+                                  device_id=SERIAL_CONFIGURATION['serial_receive_id'],
+                                  receive_mode=True,
+                                  verbose=verbose)
+            lora.start_device()
+            run(receive_loop(lora, callback))
+    except KeyboardInterrupt:
+        logger.info("Exiting...")
+    finally:
+        logger.info("Closing application...")
@@ -1,7 +1,13 @@
-from logging import getLogger, debug, info, error
+from asyncio import get_running_loop
+from binascii import hexlify
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from logging import DEBUG, getLogger
 from serial import Serial, SerialException
-from time import time, sleep
-from typing import Optional, Type
+from struct import Struct
+from sys import platform
+from time import time
+from typing import Any, Callable, Coroutine, Dict, List, NoReturn, Optional, Tuple, Type
 from types import TracebackType
 
 
@@ -26,15 +32,66 @@ class NodeModuleDriver:
     :type _VALID_PACKET_TYPES: tuple
     :ivar _VALID_FREQUENCY_RANGES: Specifies the valid frequency ranges for each region.
     :type _VALID_FREQUENCY_RANGES: dict
-    :ivar _VALID_DATA_RANGES: Specifies the valid data rates for each region.
+    :ivar _VALID_DATA_RANGES: Specifies the lowest and highest valid data rate for each region.
     :type _VALID_DATA_RANGES: dict
-    :ivar _VALID_TRANSMIT_POWERS: Range of allowed transmit powers.
-    :type _VALID_TRANSMIT_POWERS: tuple
+    :ivar _VALID_TRANSMIT_POWERS: Set of allowed transmit powers.
+    :type _VALID_TRANSMIT_POWERS: frozenset
     :ivar _VALID_BANDWIDTHS: Specifies the allowed bandwidths.
     :type _VALID_BANDWIDTHS: tuple
-    :ivar _VALID_SPREADING_FACTORS: Range of supported spreading factors.
-    :type _VALID_SPREADING_FACTORS: tuple
+    :ivar _VALID_SPREADING_FACTORS: Set of supported spreading factors.
+    :type _VALID_SPREADING_FACTORS: frozenset
+    :ivar _HEADER: Binary layout of the target and sender IDs in front of the payload.
+    :type _HEADER: Struct
+    :ivar _TERMINATORS: Line endings which mark the end of an AT command reply.
+    :type _TERMINATORS: tuple
+    :ivar _AT: Start of every AT command line.
+    :type _AT: bytes
+    :ivar _AT_PLUS: Start of every AT command line with a command name.
+    :type _AT_PLUS: bytes
+    :ivar _CRLF: Line terminator of AT commands and responses.
+    :type _CRLF: bytes
+    :ivar _SEND_PREFIX: Precomposed start of the AT command which transmits a payload.
+    :type _SEND_PREFIX: bytes
+    :ivar _CMD_TEST: Precomposed AT command which tests the connection.
+    :type _CMD_TEST: bytes
+    :ivar _CMD_RECV: Precomposed AT command which queries received data.
+    :type _CMD_RECV: bytes
+    :ivar _CMD_RECV_ON: Precomposed AT command which enables the receive mode.
+    :type _CMD_RECV_ON: bytes
+    :ivar _CMD_REBOOT: Precomposed AT command which resets the device.
+    :type _CMD_REBOOT: bytes
+    :ivar _CMD_JOIN: Precomposed AT command which starts the device.
+    :type _CMD_JOIN: bytes
+    :ivar _FMT_FREQS: Template of the AT command which sets the frequency.
+    :type _FMT_FREQS: bytes
+    :ivar _FMT_EIRP: Template of the AT command which sets the transmit power.
+    :type _FMT_EIRP: bytes
+    :ivar _FMT_BW: Template of the AT command which sets the bandwidth.
+    :type _FMT_BW: bytes
+    :ivar _FMT_SF: Template of the AT command which sets the spreading factor.
+    :type _FMT_SF: bytes
+    :ivar _FMT_DATARATE: Template of the AT command which sets the data rate.
+    :type _FMT_DATARATE: bytes
+    :ivar _FMT_SUBBAND: Template of the AT command which sets the sub-band.
+    :type _FMT_SUBBAND: bytes
+    :ivar _FMT_ADR: Template of the AT command which enables or disables ADR.
+    :type _FMT_ADR: bytes
+    :ivar _RX_BUFFER_SIZE: Size in bytes of the preallocated receive buffer.
+    :type _RX_BUFFER_SIZE: int
+    :ivar _STATUS_FIELDS: Maps the parameters queried by get_all_status() to the keys of its result.
+    :type _STATUS_FIELDS: dict
+    :ivar _HEX_DIGITS: Characters allowed in hexadecimal values.
+    :type _HEX_DIGITS: bytes
+    :ivar _SETTERS: Maps the settings accepted by configure() to their setters, in the order they are applied.
+    :type _SETTERS: dict
+    :ivar _TIMEOUT_MARGIN: Deviation in seconds up to which the read timeout of the serial port is kept.
+    :type _TIMEOUT_MARGIN: float
+    :ivar _RADIO_SETTINGS: Cache keys of the settings which the device resets when the region or mode changes.
+    :type _RADIO_SETTINGS: tuple
     """
+    __slots__ = ('_device_id', '_port', '_baudrate', '_ser', '_region', '_freq_range', '_data_range', '_mode',
+                 '_join_type', '_batch', '_rx_buf', '_cache')
+
     _DELAY: float = 0.5
     _VALID_LORA_MODES: tuple = ('LORA', 'LORAWAN')
     _VALID_REGIONS: tuple = ('EU868', 'US915', 'CN470')
@@ -47,18 +104,71 @@ class NodeModuleDriver:
         'CN470': (470000000, 510000000),
     }
     _VALID_DATA_RANGES: dict = {
-        'EU868': range(0, 6),
-        'US915': range(0, 4),
-        'CN470': range(0, 6)
+        'EU868': (0, 5),
+        'US915': (0, 3),
+        'CN470': (0, 5)
     }
-    _VALID_TRANSMIT_POWERS: tuple = range(0, 30, 2)
+    _VALID_TRANSMIT_POWERS: frozenset = frozenset(range(0, 30, 2))
     _VALID_BANDWIDTHS: tuple = (125000, 250000, 500000)
-    _VALID_SPREADING_FACTORS: tuple = range(7, 13)
+    _VALID_SPREADING_FACTORS: frozenset = frozenset(range(7, 13))
+    _HEADER: Struct = Struct('BB')
+    _TERMINATORS: tuple = (b'+SEND=OK\r\n', b'+SEND=QUEUE\r\n', b'+SEND=QU\r\n', b'+SEND=FAIL\r\n',
+                           b'OK\r\n', b'ERROR\r\n')
+    _AT: bytes = b'AT'
+    _AT_PLUS: bytes = b'AT+'
+    _CRLF: bytes = b'\r\n'
+    _SEND_PREFIX: bytes = b'AT+SEND='
+    _CMD_TEST: bytes = b'AT\r\n'
+    _CMD_RECV: bytes = b'AT+RECV?\r\n'
+    _CMD_RECV_ON: bytes = b'AT+RECV=1\r\n'
+    _CMD_REBOOT: bytes = b'AT+REBOOT\r\n'
+    _CMD_JOIN: bytes = b'AT+JOIN=1\r\n'
+    _FMT_FREQS: bytes = b'AT+FREQS=%d\r\n'
+    _FMT_EIRP: bytes = b'AT+EIRP=%d\r\n'
+    _FMT_BW: bytes = b'AT+BW=%d\r\n'
+    _FMT_SF: bytes = b'AT+SF=%d\r\n'
+    _FMT_DATARATE: bytes = b'AT+DATARATE=%d\r\n'
+    _FMT_SUBBAND: bytes = b'AT+SUBBAND=%d\r\n'
+    _FMT_ADR: bytes = b'AT+ADR=%d\r\n'
+    _RX_BUFFER_SIZE: int = 256
+    _HEX_DIGITS: bytes = b'0123456789ABCDEF'
+    _STATUS_FIELDS: dict = {
+        'LORAMODE': 'lora_mode',
+        'REGION': 'region',
+        'FREQS': 'frequency',
+        'EIRP': 'transmit_power',
+        'BW': 'bandwidth',
+        'SF': 'spreading_factor',
+        'DATARATE': 'data_rate',
+        'DEVEUI': 'dev_eui'
+    }
+    _SETTERS: dict = {
+        'region': 'set_region',
+        'mode': 'set_lora_mode',
+        'frequency': 'set_frequency',
+        'transmit_power': 'set_transmit_power',
+        'bandwidth': 'set_bandwidth',
+        'spreading_factor': 'set_spreading_factor',
+        'data_rate': 'set_data_rate',
+        'dev_type': 'set_dev_type',
+        'sub_band': 'set_sub_band',
+        'packet_type': 'set_packet_type',
+        'join_type': 'set_join_type',
+        'app_eui': 'set_app_eui',
+        'app_key': 'set_app_key',
+        'dev_addr': 'set_dev_addr',
+        'app_skey': 'set_app_skey',
+        'nwk_skey': 'set_nwk_skey',
+        'adr': 'enable_adr'
+    }
+    _TIMEOUT_MARGIN: float = 0.1
+    _RADIO_SETTINGS: tuple = ('frequency', 'data_rate', 'transmit_power', 'bandwidth', 'spreading_factor')
 
     def __init__(self, device_id: int, port: str, baudrate: int = 9600):
         """
         Initializes a communication interface for a device by specifying its device ID,
-        port, and baudrate. The device ID must be a value between 1 and 255.
+        port, and baudrate. The device ID must be a value between 1 and 255. The serial
+        port is not opened before the context is entered or open() is called.
 
         :param device_id: The ID of the device. Must be within the range 1-255.
         :type device_id: int
@@ -69,29 +179,85 @@ class NodeModuleDriver:
         :raises ValueError: If the device ID is not within the valid range.
         """
         if not (1 <= device_id <= 255):
-            error('Device ID must be between 1 and 255')
+            logger.error("Device ID must be between 1 and 255")
             raise ValueError("[ERROR] Device ID must be between 1 and 255")
 
         self._device_id = device_id
+        self._port = port
+        self._baudrate = baudrate
+        self._ser = None
         self._region = None
+        self._freq_range = None
+        self._data_range = None
         self._mode = None
         self._join_type = None
+        self._batch = None
+        self._rx_buf = bytearray(self._RX_BUFFER_SIZE)
+        self._cache = {}
+
+    @classmethod
+    def open(cls, device_id: int, port: str, baudrate: int = 9600) -> 'NodeModuleDriver':
+        """
+        Creates an interface for a device and opens its serial port immediately. The port
+        must be closed with close() when the interface is no longer needed.
+
+        :param device_id: The ID of the device. Must be within the range 1-255.
+        :type device_id: int
+        :param port: The serial port to which the device is connected.
+        :type port: str
+        :param baudrate: The baud rate for the serial communication.
+        :type baudrate: int
+        :raises ValueError: If the device ID is not within the valid range.
+        :raises RuntimeError: If the serial port cannot be opened.
+        :return: The interface with an open serial port.
+        :rtype: NodeModuleDriver
+        """
+        return cls(device_id=device_id, port=port, baudrate=baudrate).__enter__()
+
+    def close(self) -> None:
+        """
+        Closes the serial port if it is open.
+
+        :return: None
+        """
+        if self._ser is not None and self._ser.is_open:
+            self._ser.close()
+
+        self._ser = None
+
+    def _enable_low_latency(self) -> None:
+        """
+        Enables the low latency mode (ASYNC_LOW_LATENCY) of the serial port on Linux. This
+        disables the receive timer of USB serial converters, so received bytes are passed on
+        immediately instead of being held back for up to 16 ms. Ports which do not support
+        the mode are left unchanged.
+
+        :return: None
+        """
+        if not platform.startswith('linux'):
+            return
 
         try:
-            self._ser = Serial(port=port, baudrate=baudrate, timeout=1)
-        except SerialException as err:
-            error(f"Open serial port: {err}")
-            raise RuntimeError(f"[ERROR] Open serial port: {err}")
+            self._ser.set_low_latency_mode(True)
+        except (OSError, ValueError) as err:
+            logger.debug("Low latency mode not available: %s", err)
 
     def __enter__(self) -> 'NodeModuleDriver':
         """
-        Open the serial connection if it is not already open.
+        Open the serial connection with exclusive access if it is not already open.
 
         :returns: The instance of the resource that is being managed.
         :rtype: NodeModuleDriver
+        :raises RuntimeError: If the serial port cannot be opened.
         """
-        if not self._ser.is_open:
-            self._ser.open()
+        if self._ser is None:
+            try:
+                self._ser = Serial(port=self._port, baudrate=self._baudrate, timeout=1, exclusive=True)
+            except SerialException as err:
+                logger.error("Open serial port: %s", err)
+                raise RuntimeError(f"[ERROR] Open serial port: {err}")
+
+            self._enable_low_latency()
 
         return self
 
@@ -112,10 +278,20 @@ class NodeModuleDriver:
         :return: None
         """
         if exc_type is KeyboardInterrupt:
-            info("Closing serial connection.")
+            logger.info("Closing serial connection.")
 
-        if self._ser.is_open:
-            self._ser.close()
+        self.close()
+
+    def _reject(self, message: str) -> NoReturn:
+        """
+        Logs an invalid value or state and raises a ValueError with the same message.
+
+        :param message: The description of the problem.
+        :type message: str
+        :raises ValueError: Always.
+        """
+        logger.error(message)
+        raise ValueError(message)
 
     def _required_lora_mode(self, expected: str) -> None:
         """
@@ -128,12 +304,10 @@ class NodeModuleDriver:
         :return: None
         """
         if self._mode is None:
-            error("LoRa mode must be set before this operation")
-            raise ValueError("LoRa mode must be set before this operation")
+            self._reject("LoRa mode must be set before this operation")
 
         if self._mode != expected:
-            error(f"This operation requires mode: {expected}")
-            raise ValueError(f"This operation requires mode: {expected}")
+            self._reject(f"This operation requires mode: {expected}")
 
     def _required_join_type(self, expected: str) -> None:
         """
@@ -146,11 +320,10 @@ class NodeModuleDriver:
         :raises RuntimeError: If the current join type does not match the expected type.
         """
         if self._join_type is None:
-            error("LoRa join type must be set before this operation")
-            raise ValueError("LoRa join type must be set before this operation")
+            self._reject("LoRa join type must be set before this operation")
 
         if self._join_type != expected:
-            error(f"This operation requires join type: {expected}")
+            logger.error("This operation requires join type: %s", expected)
             raise RuntimeError(f"This operation requires join type: {expected}")
 
     def _required_region(self) -> None:
@@ -161,8 +334,21 @@ class NodeModuleDriver:
         :return: None
         """
         if self._region is None:
-            error("LoRa region must be set before this operation")
-            raise ValueError("LoRa region must be set before this operation")
+            self._reject("LoRa region must be set before this operation")
+
+    def _format_command(self, command: str) -> bytes:
+        """
+        Formats a command as a complete, encoded AT command line, including the '+' prefix
+        and the line terminator.
+
+        :param command: The command without the 'AT' prefix.
+        :type command: str
+        :return: The complete AT command line.
+        :rtype: bytes
+        """
+        prefix = self._AT if command.startswith('+') or command == '' else self._AT_PLUS
+
+        return b''.join((prefix, command.encode(), self._CRLF))
 
     def _send_command(self, command: str, timeout: float = 5.0) -> Optional[str]:
         """
@@ -176,41 +362,248 @@ class NodeModuleDriver:
         :return: The response from the device as a string, or None.
         :rtype: Optional[str]
         """
-        if not command.startswith('+') and command != '':
-            command = '+' + command
+        return self._send_raw(self._format_command(command), timeout)
+
+    def _discard_input(self) -> None:
+        """
+        Discards unread data from the serial input buffer, so it is not taken for the
+        response of the next command. The buffer is only flushed if it contains data,
+        which is not the case after a complete response was read.
+
+        :return: None
+        """
+        if self._ser.in_waiting:
+            self._ser.reset_input_buffer()
+
+    def _set_timeout(self, remaining: float) -> None:
+        """
+        Sets the read timeout of the serial port to the remaining time of a command. Changing
+        the timeout reconfigures the port, so the current timeout is kept as long as it does
+        not deviate from the remaining time by more than _TIMEOUT_MARGIN.
+
+        :param remaining: Time left until the deadline of the command, in seconds.
+        :type remaining: float
+        :return: None
+        """
+        if abs(self._ser.timeout - remaining) > self._TIMEOUT_MARGIN:
+            self._ser.timeout = remaining
 
-        full_command = f'AT{command}\r\n'.encode()
+    def _read_line(self, deadline: float) -> Optional[bytes]:
+        """
+        Blocks until the device sends a complete line or the deadline passes. The wait
+        happens inside the serial driver, so the method returns as soon as the line
+        terminator arrives.
+
+        :param deadline: Point in time, as returned by time(), at which to stop waiting.
+        :type deadline: float
+        :return: The received bytes, incomplete if the deadline passed, or None once it has passed.
+        :rtype: Optional[bytes]
+        """
+        remaining = deadline - time()
+
+        if remaining <= 0:
+            return None
+
+        self._set_timeout(remaining)
+
+        return self._ser.read_until(self._CRLF)
+
+    def _send_raw(self, full_command: bytes, timeout: float = 5.0) -> Optional[str]:
+        """
+        Writes a complete AT command line to the device and waits for a response.
+        While configure() collects commands, the command is only queued and None is returned.
+
+        :param full_command: The encoded AT command line, including the line terminator.
+        :type full_command: bytes
+        :param timeout: Maximum duration to wait for a response, in seconds.
+        :type timeout: float
+        :return: The response from the device as a string, or None.
+        :rtype: Optional[str]
+        """
+        if self._batch is not None:
+            self._batch.append((full_command, None, None))
+            return None
 
-        debug(f"[SEND] {full_command}")
+        logger.debug("[SEND] %s", full_command)
 
-        self._ser.reset_input_buffer()
+        self._discard_input()
         self._ser.write(full_command)
 
-        response = ""
-        start_time = time()
+        buffer = bytearray()
+        deadline = time() + timeout
 
-        while time() - start_time < timeout:
-            if self._ser.in_waiting:
-                chunk = self._ser.read(self._ser.in_waiting).decode(errors='ignore')
-                response += chunk
+        while True:
+            line = self._read_line(deadline)
+
+            if line is None:
+                break
 
-                if any(end in response for end in
-                       ['+SEND=OK',
-                        '+SEND=QUEUE',
-                        '+SEND=QU',
-                        '+SEND=FAIL',
-                        'OK',
-                        'ERROR']) and response.endswith('\r\n'):
-                    break
+            buffer += line
 
-            sleep(0.05)
+            if buffer.endswith(self._TERMINATORS):
+                break
 
-        response = response.strip()
+        response = buffer.decode(errors='ignore').strip()
 
-        debug(f"[RECV] {response}")
+        logger.debug("[RECV] %s", response)
 
         return response or None
 
+    def _send_raw_batch(self,
+                        full_commands: List[bytes],
+                        timeout: float = 5.0
+                        ) -> List[Optional[str]]:
+        """
+        Writes several complete AT command lines to the device with a single write and
+        collects the responses afterward, assigned to the commands in the order they arrive.
+
+        :param full_commands: The encoded AT command lines, including the line terminators.
+        :type full_commands: List[bytes]
+        :param timeout: Maximum duration to wait for all responses, in seconds.
+        :type timeout: float
+        :return: The responses from the device, one entry per command.
+        :rtype: List[Optional[str]]
+        """
+        data = b''.join(full_commands)
+
+        logger.debug("[SEND] %s", data)
+
+        self._discard_input()
+        self._ser.write(data)
+
+        responses = []
+        buffer = bytearray()
+        deadline = time() + timeout
+
+        while len(responses) < len(full_commands):
+            line = self._read_line(deadline)
+
+            if line is None:
+                break
+
+            buffer += line
+
+            if buffer.endswith(self._TERMINATORS):
+                responses.append(buffer.decode(errors='ignore').strip() or None)
+                buffer = bytearray()
+
+        responses += [None] * (len(full_commands) - len(responses))
+
+        logger.debug("[RECV] %s", responses)
+
+        return responses
+
+    def _remember(self, key: str, value: str, response: Optional[str]) -> None:
+        """
+        Remembers the value of a setting for the matching getter if the device confirmed
+        the command with OK, and forgets it otherwise.
+
+        :param key: The cache key of the setting, named like the getter without the 'get_' prefix.
+        :type key: str
+        :param value: The value which was sent to the device.
+        :type value: str
+        :param response: The response of the device to the command.
+        :type response: Optional[str]
+        :return: None
+        """
+        if response and response.endswith('OK'):
+            self._cache[key] = value
+        else:
+            self._cache.pop(key, None)
+
+    def _forget_radio_settings(self) -> None:
+        """
+        Forgets the remembered radio settings, which the device may reset to the defaults
+        of a new region or mode.
+
+        :return: None
+        """
+        for key in self._RADIO_SETTINGS:
+            self._cache.pop(key, None)
+
+    def _apply(self, key: str, value: object, full_command: bytes) -> None:
+        """
+        Sends the AT command of a setter and remembers the value for the matching getter.
+        While configure() collects commands, the command is only queued together with the
+        value, which is remembered once the device confirmed it.
+
+        :param key: The cache key of the setting, named like the getter without the 'get_' prefix.
+        :type key: str
+        :param value: The value which was validated by the setter.
+        :type value: object
+        :param full_command: The encoded AT command line, including the line terminator.
+        :type full_command: bytes
+        :return: None
+        """
+        if self._batch is not None:
+            self._batch.append((full_command, key, str(value)))
+            return
+
+        self._remember(key, str(value), self._send_raw(full_command))
+
+    @staticmethod
+    def _parse_field(line: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Splits a '+NAME=value' line of a response into the parameter name and its value.
+
+        :param line: A single line of a response.
+        :type line: str
+        :return: The name without the '+' prefix and the value, or None for both if the line holds no value.
+        :rtype: Tuple[Optional[str], Optional[str]]
+        """
+        name, separator, value = line.strip().partition('=')
+
+        if not separator or not name.startswith('+'):
+            return None, None
+
+        return name[1:], value or None
+
+    def _parse_value(self, response: str) -> Optional[str]:
+        """
+        Extracts the value of the first '+NAME=value' line of a response, ignoring lines
+        like the trailing 'OK'.
+
+        :param response: The response from the device.
+        :type response: str
+        :return: The value as a string, or None if the response holds no value.
+        :rtype: Optional[str]
+        """
+        for line in response.splitlines():
+            name, value = self._parse_field(line)
+
+            if name is not None:
+                return value
+
+        return None
+
+    def _query(self, key: str, command: str) -> Optional[str]:
+        """
+        Returns the remembered value of a setting, or queries it from the device.
+
+        :param key: The cache key of the setting, named like the getter without the 'get_' prefix.
+        :type key: str
+        :param command: The AT command which queries the setting.
+        :type command: str
+        :return: The value as a string, or None if not available.
+        :rtype: Optional[str]
+        """
+        value = self._cache.get(key)
+
+        if value is not None:
+            return value
+
+        response = self._send_command(command)
+
+        if not response:
+            return None
+
+        value = self._parse_value(response)
+
+        if value and not response.endswith('ERROR'):
+            self._cache[key] = value
+
+        return value
+
     def _receive_raw_data(self) -> Optional[str]:
         """
         Processes and retrieves raw data received from the 'RECV?' AT-command.
@@ -218,8 +611,8 @@ class NodeModuleDriver:
         :return: The raw data is received as a string, or None if no data is available.
         :rtype: Optional[str]
         """
-        raw_data = self._send_command('RECV?')
-        debug(raw_data)
+        raw_data = self._send_raw(self._CMD_RECV)
+        logger.debug("%s", raw_data)
 
         if not raw_data:
             return None
@@ -267,11 +660,13 @@ class NodeModuleDriver:
         :return: None
         """
         if mode not in self._VALID_LORA_MODES:
-            error(f"Invalid LoRa mode: {mode}")
-            raise ValueError(f"Invalid LoRa mode. Allowed modes: {self._VALID_LORA_MODES}")
+            self._reject(f"Invalid LoRa mode {mode}. Allowed modes: {self._VALID_LORA_MODES}")
 
-        self._mode = mode.upper()
-        self._send_command(f'LORAMODE={mode.upper()}')
+        if mode != self._mode:
+            self._forget_radio_settings()
+
+        self._mode = mode
+        self._apply('lora_mode', mode, self._format_command(f'LORAMODE={mode}'))
 
     def set_region(self, value: str = 'EU868') -> None:
         """
@@ -287,11 +682,15 @@ class NodeModuleDriver:
         :return: None
         """
         if value not in self._VALID_REGIONS:
-            error(f"Invalid region: {value}")
-            raise ValueError(f"Invalid region. Allowed regions: {self._VALID_REGIONS}")
+            self._reject(f"Invalid region {value}. Allowed regions: {self._VALID_REGIONS}")
+
+        if value != self._region:
+            self._forget_radio_settings()
 
-        self._region = str(value)
-        self._send_command(f'REGION={self._region}')
+        self._region = value
+        self._freq_range = self._VALID_FREQUENCY_RANGES[value]
+        self._data_range = self._VALID_DATA_RANGES[value]
+        self._apply('region', value, self._format_command(f'REGION={value}'))
 
     def set_frequency(self, value: int) -> None:
         """
@@ -307,14 +706,13 @@ class NodeModuleDriver:
         """
         self._required_region()
 
-        min_freq, max_freq = self._VALID_FREQUENCY_RANGES[self._region]
+        min_freq, max_freq = self._freq_range
 
         if not (min_freq <= value <= max_freq):
-            error(f"Frequency {value} out of range for region {self._region}.")
-            raise ValueError(f"Frequency {value} out of range for region {self._region}. "
-                             f"Valid range: {min_freq} - {max_freq} Hz")
+            self._reject(f"Frequency {value} out of range for region {self._region}. "
+                         f"Valid range: {min_freq} - {max_freq} Hz")
 
-        self._send_command(f'FREQS={value}')
+        self._apply('frequency', value, self._FMT_FREQS % value)
 
     def set_transmit_power(self, value: int) -> None:
         """
@@ -327,10 +725,10 @@ class NodeModuleDriver:
         :return: None
         """
         if value not in self._VALID_TRANSMIT_POWERS:
-            error(f"Invalid transmit power: {value}")
-            raise ValueError(f"Invalid transmit power. Allowed values: {self._VALID_TRANSMIT_POWERS}")
+            self._reject(f"Invalid transmit power {value}. "
+                         f"Allowed values: {sorted(self._VALID_TRANSMIT_POWERS)}")
 
-        self._send_command(f'EIRP={value}')
+        self._apply('transmit_power', value, self._FMT_EIRP % value)
 
     def set_bandwidth(self, value: int) -> None:
         """
@@ -345,10 +743,9 @@ class NodeModuleDriver:
         :return: None
         """
         if value not in self._VALID_BANDWIDTHS:
-            error(f"Invalid bandwidth: {value}")
-            raise ValueError(f"Invalid bandwidth. Allowed: {self._VALID_BANDWIDTHS}")
+            self._reject(f"Invalid bandwidth {value}. Allowed: {self._VALID_BANDWIDTHS}")
 
-        self._send_command(f'BW={value}')
+        self._apply('bandwidth', value, self._FMT_BW % value)
 
     def set_spreading_factor(self, value: int) -> None:
         """
@@ -361,10 +758,9 @@ class NodeModuleDriver:
         :return: None
         """
         if value not in self._VALID_SPREADING_FACTORS:
-            error(f"Invalid SF: {value}")
-            raise ValueError(f"Invalid SF. Allowed: {list(self._VALID_SPREADING_FACTORS)}")
+            self._reject(f"Invalid SF {value}. Allowed: {sorted(self._VALID_SPREADING_FACTORS)}")
 
-        self._send_command(f'SF={value}')
+        self._apply('spreading_factor', value, self._FMT_SF % value)
 
     def set_data_rate(self, value: int) -> None:
         """
@@ -380,11 +776,13 @@ class NodeModuleDriver:
         self._required_lora_mode('LORAWAN')
         self._required_region()
 
-        if value not in self._VALID_DATA_RANGES[self._region]:
-            error(f"Invalid data rate {value} for region {self._region}")
-            raise ValueError(f"Invalid data rate for region {self._region}.")
+        min_rate, max_rate = self._data_range
+
+        if not (min_rate <= value <= max_rate):
+            self._reject(f"Invalid data rate {value} for region {self._region}. "
+                         f"Valid range: {min_rate} - {max_rate}")
 
-        self._send_command(f'+DATARATE={value}')
+        self._apply('data_rate', value, self._FMT_DATARATE % value)
 
     def set_dev_type(self, value: str) -> None:
         """
@@ -401,8 +799,7 @@ class NodeModuleDriver:
         class_type = value.upper()
 
         if class_type not in self._VALID_NET_TYPES:
-            error("Device class must be CLASS_A or CLASS_C")
-            raise ValueError("Device class must be CLASS_A or CLASS_C")
+            self._reject("Device class must be CLASS_A or CLASS_C")
 
         self._send_command(f'CLASS={class_type}')
 
@@ -420,14 +817,12 @@ class NodeModuleDriver:
         self._required_lora_mode('LORAWAN')
 
         if self._region not in {'US915', 'CN470'}:
-            error("Sub-band selection is only available for US915 and CN470 regions")
-            raise ValueError("Sub-band selection is only available for US915 and CN470 regions")
+            self._reject("Sub-band selection is only available for US915 and CN470 regions")
 
         if not (0 <= value <= 15):
-            error("Sub-band must be between 0 and 15")
-            raise ValueError("Sub-band must be between 0 and 15")
+            self._reject("Sub-band must be between 0 and 15")
 
-        self._send_command(f'SUBBAND={value}')
+        self._send_raw(self._FMT_SUBBAND % value)
 
     def set_packet_type(self, value: str) -> None:
         """
@@ -445,8 +840,7 @@ class NodeModuleDriver:
         mode = value.upper()
 
         if mode not in self._VALID_PACKET_TYPES:
-            error("Packet type must be either CONFIRMED or UNCONFIRMED")
-            raise ValueError("Packet type must be either CONFIRMED or UNCONFIRMED")
+            self._reject("Packet type must be either CONFIRMED or UNCONFIRMED")
 
         self._send_command(f'UPLINKTYPE={mode}')
 
@@ -466,8 +860,7 @@ class NodeModuleDriver:
         join_type = value.upper()
 
         if join_type not in self._VALID_JOIN_TYPES:
-            error(f"Invalid join type: {join_type}")
-            raise ValueError("Join type must be either OTAA or ABP")
+            self._reject(f"Invalid join type {join_type}. Join type must be either OTAA or ABP")
 
         self._join_type = join_type
         self._send_command(f'JOINTYPE={join_type}')
@@ -488,8 +881,7 @@ class NodeModuleDriver:
         app_eui = value.upper()
 
         if len(app_eui) != 16:
-            error("AppEUI must be 16 characters (8 bytes in hex)")
-            raise ValueError("AppEUI must be 16 characters (8 bytes in hex)")
+            self._reject("AppEUI must be 16 characters (8 bytes in hex)")
 
         self._send_command(f'JOINEUI={app_eui}')
 
@@ -509,8 +901,7 @@ class NodeModuleDriver:
         app_key = value.upper()
 
         if len(app_key) != 32:
-            error("AppKey must be 32 characters (16 bytes in hex)")
-            raise ValueError("AppKey must be 32 characters (16 bytes in hex)")
+            self._reject("AppKey must be 32 characters (16 bytes in hex)")
 
         self._send_command(f'APPKEY={app_key}')
 
@@ -530,9 +921,8 @@ class NodeModuleDriver:
 
         dev_addr = value.upper()
 
-        if len(dev_addr) != 8 or not all(c in '0123456789ABCDEF' for c in dev_addr):
-            error("DevAddr must be 8 hex characters (0–9, A–F)")
-            raise ValueError("DevAddr must be 8 hex characters (0–9, A–F)")
+        if len(dev_addr) != 8 or dev_addr.encode().translate(None, self._HEX_DIGITS):
+            self._reject("DevAddr must be 8 hex characters (0–9, A–F)")
 
         self._send_command(f'DEVADDR={dev_addr}')
 
@@ -552,8 +942,7 @@ class NodeModuleDriver:
         app_skey = value.upper()
 
         if len(app_skey) != 32:
-            error("AppSKey must be 32 characters (16 bytes in hex)")
-            raise ValueError("AppSKey must be 32 characters (16 bytes in hex)")
+            self._reject("AppSKey must be 32 characters (16 bytes in hex)")
 
         self._send_command(f'APPSKEY={app_skey}')
 
@@ -573,8 +962,7 @@ class NodeModuleDriver:
         nwk_skey = value.upper()
 
         if len(nwk_skey) != 32:
-            error("NwkSKey must be 32 characters (16 bytes in hex)")
-            raise ValueError("NwkSKey must be 32 characters (16 bytes in hex)")
+            self._reject("NwkSKey must be 32 characters (16 bytes in hex)")
 
         self._send_command(f'NWKSKEY={nwk_skey}')
 
@@ -590,8 +978,7 @@ class NodeModuleDriver:
         """
         self._required_lora_mode('LORAWAN')
 
-        cmd = f'ADR={1 if value else 0}'
-        self._send_command(cmd)
+        self._send_raw(self._FMT_ADR % bool(value))
 
     def enable_receive_mode(self) -> None:
         """
@@ -599,15 +986,19 @@ class NodeModuleDriver:
 
         :return: None
         """
-        self._send_command('RECV=1')
+        self._send_raw(self._CMD_RECV_ON)
 
-    def test_device(self) -> None:
+    def test_device(self) -> Optional[str]:
         """
         Tests the serial connection to the device by sending an empty command.
 
-        :return: None
+        :return: The response from the device as a string, or None.
+        :rtype: Optional[str]
         """
-        info(self._send_command(''))
+        response = self._send_raw(self._CMD_TEST)
+        logger.info("%s", response)
+
+        return response
 
     def reset_device(self) -> None:
         """
@@ -615,7 +1006,32 @@ class NodeModuleDriver:
 
         :return: None
         """
-        self._send_command('REBOOT')
+        self.invalidate_cache()
+        self._send_raw(self._CMD_REBOOT)
+
+    def wait_ready(self, timeout: float = 2.0, interval: float = 0.05) -> bool:
+        """
+        Waits until the device answers the 'AT' test command, for example after a reset.
+        The device is probed repeatedly, so the method returns as soon as it is ready
+        instead of waiting for a fixed period of time.
+
+        :param timeout: Maximum duration to wait for the device, in seconds.
+        :type timeout: float
+        :param interval: Maximum duration to wait for the response to each probe, in seconds.
+        :type interval: float
+        :return: True if the device is ready, False if the timeout expired.
+        :rtype: bool
+        """
+        start_time = time()
+
+        while time() - start_time < timeout:
+            response = self._send_raw(self._CMD_TEST, timeout=interval)
+
+            if response and response.endswith('OK'):
+                return True
+
+        logger.error("Device not ready")
+        return False
 
     def start_device(self) -> None:
         """
@@ -623,7 +1039,86 @@ class NodeModuleDriver:
 
         :return: None
         """
-        self._send_command('JOIN=1')
+        self.invalidate_cache()
+        self._send_raw(self._CMD_JOIN)
+
+    def send_at_batch(self, commands: List[str], timeout: float = 5.0) -> List[Optional[str]]:
+        """
+        Sends several AT commands to the device with a single write and collects the
+        responses afterward. The responses are assigned to the commands in the order
+        they arrive, so the device is only waited for once instead of once per command.
+
+        :param commands: The AT commands to send.
+        :type commands: List[str]
+        :param timeout: Maximum duration to wait for all responses, in seconds.
+        :type timeout: float
+        :return: The responses from the device, one entry per command.
+        :rtype: List[Optional[str]]
+        """
+        return self._send_raw_batch([self._format_command(command) for command in commands], timeout)
+
+    def configure(self, **settings: Any) -> List[Optional[str]]:
+        """
+        Applies several settings with a single write and returns the responses of the device.
+        Each setting is validated by its setter, e.g. region='EU868' by set_region(). The
+        settings are applied in a fixed order, so the region and mode are known before the
+        settings which depend on them are validated. If a setting is invalid, nothing is sent
+        and the driver keeps its previous state.
+
+        :param settings: The settings to apply, named like the setters without the 'set_' prefix.
+        :type settings: Any
+        :raises ValueError: If a setting is unknown or its value is invalid.
+        :return: The responses from the device, one entry per setting.
+        :rtype: List[Optional[str]]
+        """
+        unknown = settings.keys() - self._SETTERS.keys()
+
+        if unknown:
+            self._reject(f"Unknown settings: {sorted(unknown)}. Allowed: {tuple(self._SETTERS)}")
+
+        state = (self._region, self._freq_range, self._data_range, self._mode, self._join_type)
+        self._batch = []
+
+        try:
+            for name, setter in self._SETTERS.items():
+                if name in settings:
+                    getattr(self, setter)(settings[name])
+        except BaseException:
+            self._region, self._freq_range, self._data_range, self._mode, self._join_type = state
+            raise
+        finally:
+            queued, self._batch = self._batch, None
+
+        if not queued:
+            return []
+
+        responses = self._send_raw_batch([command for command, _, _ in queued])
+
+        for (_, key, value), response in zip(queued, responses):
+            if key is not None:
+                self._remember(key, value, response)
+
+        return responses
+
+    def invalidate_cache(self) -> None:
+        """
+        Forgets the settings remembered by the getters, so they are queried from the device
+        again. The cache is cleared automatically on reset_device() and start_device(); call
+        this method if the device was changed in another way, for example by ADR.
+
+        :return: None
+        """
+        self._cache.clear()
+
+    def fileno(self) -> int:
+        """
+        Returns the file descriptor of the underlying serial port. This allows
+        the device to be registered with selectors to wait for incoming data.
+
+        :return: The file descriptor of the serial port.
+        :rtype: int
+        """
+        return self._ser.fileno()
 
     def get_lora_mode(self) -> Optional[str]:
         """
@@ -632,8 +1127,7 @@ class NodeModuleDriver:
         :return: The LoRa mode as a string, or None if not available.
         :rtype: Optional[str]
         """
-        response = self._send_command('LORAMODE?')
-        return response.split('=')[-1] if response else None
+        return self._query('lora_mode', 'LORAMODE?')
 
     def get_region(self) -> Optional[str]:
         """
@@ -642,8 +1136,7 @@ class NodeModuleDriver:
         :return: The region as a string, or None if not available.
         :rtype: Optional[str]
         """
-        response = self._send_command('REGION?')
-        return response.split('=')[-1] if response else None
+        return self._query('region', 'REGION?')
 
     def get_frequency(self) -> Optional[str]:
         """
@@ -652,8 +1145,7 @@ class NodeModuleDriver:
         :return: The frequency as a string, or None if not available.
         :rtype: Optional[str]
         """
-        response = self._send_command('FREQS?')
-        return response.split('=')[-1] if response else None
+        return self._query('frequency', 'FREQS?')
 
     def get_transmit_power(self) -> Optional[str]:
         """
@@ -662,8 +1154,7 @@ class NodeModuleDriver:
         :return: The transmit power as a string, or None if not available.
         :rtype: Optional[str]
         """
-        response = self._send_command('EIRP?')
-        return response.split('=')[-1] if response else None
+        return self._query('transmit_power', 'EIRP?')
 
     def get_bandwidth(self) -> Optional[str]:
         """
@@ -672,8 +1163,7 @@ class NodeModuleDriver:
         :return: The bandwidth as a string, or None if not available.
         :rtype: Optional[str]
         """
-        response = self._send_command('BW?')
-        return response.split('=')[-1] if response else None
+        return self._query('bandwidth', 'BW?')
 
     def get_spreading_factor(self) -> Optional[str]:
         """
@@ -682,8 +1172,7 @@ class NodeModuleDriver:
         :return: The spreading factor as a string, or None if not available.
         :rtype: Optional[str]
         """
-        response = self._send_command('SF?')
-        return response.split('=')[-1] if response else None
+        return self._query('spreading_factor', 'SF?')
 
     def get_data_rate(self) -> Optional[str]:
         """
@@ -692,8 +1181,7 @@ class NodeModuleDriver:
         :return: The data range value as a string if available, otherwise None.
         :rtype: Optional[str]
         """
-        response = self._send_command('DATARATE?')
-        return response.split('=')[-1] if response else None
+        return self._query('data_rate', 'DATARATE?')
 
     def get_dev_eui(self) -> Optional[str]:
         """
@@ -702,8 +1190,7 @@ class NodeModuleDriver:
         :return: The DEVEUI as a string if available, otherwise None.
         :rtype: Optional[str]
         """
-        response = self._send_command('DEVEUI?')
-        return response.split('=')[-1] if response else None
+        return self._query('dev_eui', 'DEVEUI?')
 
     def get_net_id(self) -> Optional[str]:
         """
@@ -714,7 +1201,7 @@ class NodeModuleDriver:
         :rtype: Optional[str]
         """
         response = self._send_command('NETID?')
-        return response.split('=')[-1] if response else None
+        return self._parse_value(response) if response else None
 
     def get_dev_addr(self) -> Optional[str]:
         """
@@ -725,7 +1212,7 @@ class NodeModuleDriver:
         :rtype: Optional[str]
         """
         response = self._send_command('DEVADDR?')
-        return response.split('=')[-1] if response else None
+        return self._parse_value(response) if response else None
 
     def get_eirp(self) -> Optional[str]:
         """
@@ -736,7 +1223,52 @@ class NodeModuleDriver:
         :rtype: Optional[str]
         """
         response = self._send_command('EIRP?')
-        return response.split('=')[-1] if response else None
+        return self._parse_value(response) if response else None
+
+    def get_all_status(self, timeout: float = 5.0) -> Dict[str, Optional[str]]:
+        """
+        Gets the LoRa mode, region, frequency, transmit power, bandwidth, spreading factor,
+        data rate and DevEUI with a single write. The answers are collected as they arrive,
+        until every query was answered with OK or ERROR, so the device is only waited for
+        once instead of once per getter. Values which are not available are None.
+
+        :param timeout: Maximum duration to wait for all answers, in seconds.
+        :type timeout: float
+        :return: The values as strings, keyed like the getters without the 'get_' prefix.
+        :rtype: Dict[str, Optional[str]]
+        """
+        commands = ''.join(f'AT+{name}?\r\n' for name in self._STATUS_FIELDS).encode()
+
+        logger.debug("[SEND] %s", commands)
+
+        self._discard_input()
+        self._ser.write(commands)
+
+        status = dict.fromkeys(self._STATUS_FIELDS.values())
+        replies = 0
+        deadline = time() + timeout
+
+        while replies < len(self._STATUS_FIELDS):
+            line = self._read_line(deadline)
+
+            if line is None:
+                break
+
+            if line.endswith(self._TERMINATORS):
+                replies += 1
+                continue
+
+            name, value = self._parse_field(line.decode(errors='ignore'))
+            field = self._STATUS_FIELDS.get(name)
+
+            if field is not None and status[field] is None:
+                status[field] = value
+
+        logger.debug("[RECV] %s", status)
+
+        self._cache.update((key, value) for key, value in status.items() if value)
+
+        return status
 
     def is_joined(self) -> bool:
         """
@@ -750,7 +1282,7 @@ class NodeModuleDriver:
         response = self._send_command('JOIN?')
         joined = response and response.strip() == '+JOIN=1'
 
-        info(f"Device join status: {'joined' if joined else 'not joined'}")
+        logger.info("Device join status: %s", 'joined' if joined else 'not joined')
         return joined
 
     def send_data(self, target_id: int, data: str) -> None:
@@ -771,28 +1303,21 @@ class NodeModuleDriver:
         :return: None
         """
         if not (1 <= target_id <= 255):
-            error(f"Invalid target ID: {target_id}")
-            raise ValueError("Target ID must be between 1 and 255")
+            self._reject(f"Invalid target ID {target_id}. Target ID must be between 1 and 255")
 
         if target_id == self._device_id:
-            error("Target ID cannot be the same as the Device ID")
-            raise ValueError("Target ID cannot be the same as the Device ID")
+            self._reject("Target ID cannot be the same as the Device ID")
 
         if self._mode is None:
-            error("LoRa mode must be set before sending data")
-            raise ValueError("LoRa mode must be set before sending data")
+            self._reject("LoRa mode must be set before sending data")
 
         if self._mode == 'LORAWAN':
             if self._join_type is None:
-                error("Join type must be set before sending data in LoRaWAN mode")
-                raise ValueError("Join type must be set before sending data in LoRaWAN mode")
+                self._reject("Join type must be set before sending data in LoRaWAN mode")
 
-        to_hex = f'{target_id:02X}'
-        from_hex = f'{self._device_id:02X}'
-        data_hex = data.encode().hex().upper()
-        payload = to_hex + from_hex + data_hex
+        payload = hexlify(self._HEADER.pack(target_id, self._device_id) + data.encode()).upper()
 
-        self._send_command(f'SEND={payload}')
+        self._send_raw(b''.join((self._SEND_PREFIX, payload, self._CRLF)))
 
     def receive_specific_data(self) -> Optional[str]:
         """
@@ -815,13 +1340,13 @@ class NodeModuleDriver:
         if len(data_bytes) < 2:
             return None
 
-        to_id = data_bytes[0]
-        from_id = data_bytes[1]
+        to_id, from_id = self._HEADER.unpack_from(data_bytes)
+        view = memoryview(data_bytes)
         tab_idx = data_bytes.find(b"\t")
-        payload_bytes = data_bytes[tab_idx + 1:] if tab_idx != -1 else data_bytes[2:]
-        payload = payload_bytes.decode("utf-8", errors="replace")
+        payload_bytes = view[tab_idx + 1:] if tab_idx != -1 else view[self._HEADER.size:]
+        payload = bytes(payload_bytes).decode("utf-8", errors="replace")
 
-        debug(f"To: {to_id}, From: {from_id}, Payload: {payload}")
+        logger.debug("To: %s, From: %s, Payload: %s", to_id, from_id, payload)
 
         if to_id == self._device_id:
             value = payload
@@ -853,3 +1378,162 @@ class NodeModuleDriver:
             return value
         else:
             return None
+
+    def receive_into(self) -> Tuple[int, memoryview]:
+        """
+        Works like receive_data(), but reads the response of the 'RECV?' AT-command into
+        a preallocated buffer and extracts the payload without copying it. The returned
+        view points into this buffer and is only valid until the next call. A response
+        which does not fit into the buffer is discarded.
+
+        :return: The payload size and a view of the payload, which is empty if no data is available.
+        :rtype: Tuple[int, memoryview]
+        """
+        buf = self._rx_buf
+        view = memoryview(buf)
+        size = 0
+        timeout = 5.0
+
+        self._discard_input()
+        self._ser.write(self._CMD_RECV)
+
+        deadline = time() + timeout
+
+        while size < len(buf):
+            remaining = deadline - time()
+
+            if remaining <= 0:
+                break
+
+            self._set_timeout(remaining)
+            chunk = min(max(self._ser.in_waiting, 1), len(buf) - size)
+            size += self._ser.readinto(view[size:size + chunk])
+
+            if buf.endswith(self._TERMINATORS, 0, size):
+                break
+
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("[RECV] %s", bytes(view[:size]))
+
+        if size == len(buf) and not buf.endswith(self._TERMINATORS):
+            logger.error("Response exceeds the receive buffer of %d bytes", len(buf))
+            return 0, view[:0]
+
+        end = size
+
+        while True:
+            start = buf.rfind(b'+RECV=', 0, end)
+
+            if start == -1:
+                return 0, view[:0]
+
+            line_end = buf.find(b'\r\n', start, size)
+            line_end = size if line_end == -1 else line_end
+
+            if view[start:line_end] == b'+RECV=OK' or buf[buf.rfind(b'\n', 0, start) + 1:start].strip():
+                end = start
+                continue
+
+            tab_idx = buf.find(b'\t', start, line_end)
+
+            if tab_idx == -1:
+                tab_idx = buf.find(b' ', start, line_end)
+
+            payload = view[tab_idx + 1 if tab_idx != -1 else start:line_end]
+
+            return len(payload), payload
+
+
+class AsyncNodeModuleDriver:
+    """
+    Provides an asyncio interface for the DFRobot LoRaWAN Node Module. Every public method
+    of NodeModuleDriver is available as a coroutine with the same name and arguments. The
+    calls run one after the other in a single worker thread, so other coroutines keep running
+    while the driver waits for the device.
+    """
+    __slots__ = ('_driver', '_executor')
+
+    def __init__(self, device_id: int, port: str, baudrate: int = 9600):
+        """
+        Initializes the wrapped NodeModuleDriver and the worker thread which executes its calls.
+
+        :param device_id: The ID of the device. Must be within the range 1-255.
+        :type device_id: int
+        :param port: The serial port to which the device is connected.
+        :type port: str
+        :param baudrate: The baud rate for the serial communication.
+        :type baudrate: int
+        :raises ValueError: If the device ID is not within the valid range.
+        """
+        self._driver = NodeModuleDriver(device_id=device_id, port=port, baudrate=baudrate)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='lora')
+
+    async def __aenter__(self) -> 'AsyncNodeModuleDriver':
+        """
+        Open the serial connection if it is not already open.
+
+        :returns: The instance of the resource that is being managed.
+        :rtype: AsyncNodeModuleDriver
+        """
+        await self.call(self._driver.__enter__)
+        return self
+
+    async def __aexit__(self,
+                        exc_type: Optional[Type[BaseException]],
+                        exc_val: Optional[BaseException],
+                        exc_tb: Optional[TracebackType]
+                        ) -> None:
+        """
+        Close the serial connection and shut down the worker thread.
+
+        :param exc_type: The exception type that caused the exit from the context block.
+        :type exc_type: Optional[Type[BaseException]]
+        :param exc_val: The exception instance that caused the exit from the context block.
+        :type exc_val: Optional[BaseException]
+        :param exc_tb: The traceback that caused the exit from the context block.
+        :type exc_tb: Optional[TracebackType]
+        :return: None
+        """
+        try:
+            await self.call(self._driver.__exit__, exc_type, exc_val, exc_tb)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """
+        Returns a coroutine function for the public NodeModuleDriver method with the given name.
+
+        :param name: The name of the NodeModuleDriver method.
+        :type name: str
+        :return: A coroutine function which runs the method in the worker thread.
+        :rtype: Callable[..., Coroutine[Any, Any, Any]]
+        :raises AttributeError: If the name is private or not a method of NodeModuleDriver.
+        """
+        method = getattr(self._driver, name) if not name.startswith('_') else None
+
+        if not callable(method):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await self.call(method, *args, **kwargs)
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    async def call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a method of the wrapped driver in the worker thread and waits for its result.
+        Calls are executed in the order they were made, so a sequence of setters is sent to
+        the device in the same order as with NodeModuleDriver.
+
+        :param method: The method to call.
+        :type method: Callable[..., Any]
+        :param args: The positional arguments passed to the method.
+        :type args: Any
+        :param kwargs: The keyword arguments passed to the method.
+        :type kwargs: Any
+        :return: The return value of the method.
+        :rtype: Any
+        """
+        return await get_running_loop().run_in_executor(self._executor, partial(method, *args, **kwargs))
@@ -1,42 +1,85 @@
+from binascii import hexlify, unhexlify
 from machine import UART, Pin
-from time import sleep_ms, ticks_ms, ticks_diff
+from micropython import const
+from select import poll, POLLIN
+from struct import pack, unpack_from
+from time import sleep_ms, ticks_add, ticks_ms, ticks_diff
+
+
+_MIN_ID = const(1)
+_MAX_ID = const(255)
+_MAX_SUB_BAND = const(15)
+_MS_PER_S = const(1000)
+_TAIL_LEN = const(16)
+_WAIT_BITS = const(80000)
+_RX_BUFFER_SIZE = const(256)
 
 
 class NodeModuleDriver:
 
-    _VALID_LORA_MODES: tuple = ('LORA', 'LORAWAN')
-    _VALID_REGIONS: tuple = ('EU868', 'US915', 'CN470')
-    _VALID_JOIN_TYPES: tuple = ('OTAA', 'ABP')
-    _VALID_NET_TYPES: tuple = ('CLASS_A', 'CLASS_C')
-    _VALID_PACKET_TYPES: tuple = ('CONFIRMED', 'UNCONFIRMED')
+    _VALID_LORA_MODES: frozenset = frozenset(('LORA', 'LORAWAN'))
+    _VALID_REGIONS: frozenset = frozenset(('EU868', 'US915', 'CN470'))
+    _VALID_JOIN_TYPES: frozenset = frozenset(('OTAA', 'ABP'))
+    _VALID_NET_TYPES: frozenset = frozenset(('CLASS_A', 'CLASS_C'))
+    _VALID_PACKET_TYPES: frozenset = frozenset(('CONFIRMED', 'UNCONFIRMED'))
     _VALID_FREQUENCY_RANGES: dict = {
         'EU868': (863000000, 870000000),
         'US915': (902000000, 928000000),
         'CN470': (470000000, 510000000),
     }
     _VALID_DATA_RANGES: dict = {
-        'EU868': range(0, 6),
-        'US915': range(0, 4),
-        'CN470': range(0, 6)
+        'EU868': frozenset(range(0, 6)),
+        'US915': frozenset(range(0, 4)),
+        'CN470': frozenset(range(0, 6))
     }
-    _VALID_TRANSMIT_POWERS: tuple = range(0, 30, 2)
-    _VALID_BANDWIDTHS: tuple = (125000, 250000, 500000)
-    _VALID_SPREADING_FACTORS: tuple = range(7, 13)
+    _VALID_TRANSMIT_POWERS: frozenset = frozenset(range(0, 30, 2))
+    _VALID_BANDWIDTHS: frozenset = frozenset((125000, 250000, 500000))
+    _VALID_SPREADING_FACTORS: frozenset = frozenset(range(7, 13))
+    _AT_PROBE: bytes = b'AT\r\n'
+    _AT_PLUS: bytes = b'AT+'
+    _CRLF: bytes = b'\r\n'
+    _SEND_PREFIX: bytes = b'AT+SEND='
+    _QUERIES: dict = {
+        'lora_mode': b'LORAMODE?',
+        'region': b'REGION?',
+        'frequency': b'FREQS?',
+        'transmit_power': b'EIRP?',
+        'bandwidth': b'BW?',
+        'spreading_factor': b'SF?',
+        'data_rate': b'DATARATE?',
+        'dev_eui': b'DEVEUI?',
+        'net_id': b'NETID?',
+        'dev_addr': b'DEVADDR?'
+    }
+    _OK_TERMINATORS: tuple = (b"OK\r\n", b"+SEND=QUEUE\r\n")
+    _ERROR_TERMINATORS: tuple = (b"ERROR\r\n", b"+SEND=FAIL\r\n")
+    _RADIO_SETTINGS: tuple = (b'FREQS=', b'EIRP=', b'BW=', b'SF=', b'DATARATE=')
 
     def __init__(self, device_id: int, uart_instance: int, tx: int, rx: int, baudrate: int = 9600):
-        if not (1 <= device_id <= 255):
+        if not (_MIN_ID <= device_id <= _MAX_ID):
             raise ValueError("[ERROR] Device ID must be between 1 and 255")
 
         self._device_id = device_id
         self._region = None
         self._mode = None
         self._join_type = None
+        self._rx_buf = bytearray(_RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+        self._cache = {}
 
         try:
             self._uart = UART(uart_instance, baudrate=baudrate, tx=Pin(tx), rx=Pin(rx))
         except Exception as err:
             raise RuntimeError(f"[ERROR] Failed to init UART{uart_instance} on TX={tx}, RX={rx}: {err}")
 
+        self._max_wait_ms = max(1, _WAIT_BITS // baudrate)
+
+        try:
+            self._poller = poll()
+            self._poller.register(self._uart, POLLIN)
+        except (OSError, TypeError):
+            self._poller = None
+
     def _required_lora_mode(self, expected: str):
         if self._mode is None:
             raise ValueError("LoRa mode must be set before this operation")
@@ -55,37 +98,97 @@ class NodeModuleDriver:
         if self._region is None:
             raise ValueError("LoRa region must be set before this operation")
 
-    def _send_command(self, command: str, timeout: float = 0.5):
-        if not command.startswith('+') and command != '':
-            command = '+' + command
+    @staticmethod
+    def _check_hex(value: str, length: int, message: str):
+        try:
+            if len(value) == length:
+                unhexlify(value)
+                return
+        except ValueError:
+            pass
+
+        raise ValueError(message)
+
+    def _at_plus(self, command: bytes, timeout: float = 0.5):
+        return self._send_raw(self._AT_PLUS + command + self._CRLF, timeout)
+
+    def _at_probe(self, timeout: float = 0.5):
+        return self._send_raw(self._AT_PROBE, timeout)
+
+    def _match_terminator(self, buffer: bytearray):
+        tail = bytes(buffer[-_TAIL_LEN:])
+
+        for end in self._OK_TERMINATORS:
+            if tail.endswith(end):
+                return True
+
+        for end in self._ERROR_TERMINATORS:
+            if tail.endswith(end):
+                return False
 
-        full_command = f'AT{command}\r\n'.encode()
+        return None
+
+    def _exchange(self, full_command: bytes, timeout: float = 0.5):
         self._uart.write(full_command)
 
-        response = ""
-        start = ticks_ms()
-
-        while ticks_diff(ticks_ms(), start) < int(timeout * 1000):
-            if self._uart.any():
-                chunk = self._uart.read().decode("utf-8", "ignore")
-                response += chunk
-
-                if any(end in response for end in [
-                    "+SEND=OK",
-                    "+SEND=QUEUE",
-                    "+SEND=FAIL",
-                    "OK",
-                    "ERROR"
-                ]) and response.endswith("\r\n"):
+        ok = None
+        buffer = bytearray()
+        deadline = ticks_add(ticks_ms(), int(timeout * _MS_PER_S))
+        wait = 1
+
+        while True:
+            remaining = ticks_diff(deadline, ticks_ms())
+
+            if remaining <= 0:
+                break
+
+            if self._poller:
+                self._poller.poll(remaining)
+
+            count = self._uart.any()
+
+            if count:
+                count = self._uart.readinto(self._rx_buf, min(count, _RX_BUFFER_SIZE)) or 0
+                buffer.extend(self._rx_view[:count])
+
+                ok = self._match_terminator(buffer)
+
+                if ok is not None:
                     break
-            sleep_ms(50)
 
-        response = response.strip()
+                wait = 1
+            elif not self._poller:
+                sleep_ms(min(wait, remaining))
+                wait = min(wait * 2, self._max_wait_ms)
+
+        response = buffer.decode("utf-8", "ignore").strip()
+
+        return ok, response or None
+
+    def _send_raw(self, full_command: bytes, timeout: float = 0.5):
+        return self._exchange(full_command, timeout)[1]
+
+    def _set(self, name: bytes, value: bytes):
+        if self._cache.get(name) == value:
+            return
 
-        return response or None
+        ok, _ = self._exchange(self._AT_PLUS + name + value + self._CRLF)
+
+        if ok:
+            self._cache[name] = value
+        else:
+            self._cache.pop(name, None)
+
+    def _forget_radio_settings(self):
+        for name in self._RADIO_SETTINGS:
+            self._cache.pop(name, None)
+
+    def _query(self, command: bytes):
+        response = self._at_plus(command)
+        return response.rpartition('=')[2] if response else None
 
     def _receive_raw_data(self):
-        raw_data = self._send_command('RECV?')
+        raw_data = self._at_plus(b'RECV?')
 
         if not raw_data:
             return None
@@ -93,44 +196,53 @@ class NodeModuleDriver:
             return raw_data
 
     def _filter_raw_data(self):
-        filtered_data = None
         raw_response = self._receive_raw_data()
 
         if not raw_response:
             return None
 
-        for line in raw_response.splitlines():
-            s = line.strip()
+        end = len(raw_response)
 
-            if not s or s in {"+RECV=OK", "The list is empty!"} or s.startswith("+RECV:NO DATA"):
-                continue
+        while True:
+            start = raw_response.rfind("+RECV=", 0, end)
 
-            if not s.startswith("+RECV="):
-                continue
+            if start == -1:
+                return None
 
-            if s.startswith("+RECV="):
-                for junk in ("+RECV=OK", "The list is empty!", "+RECV:NO DATA", "OK", "ERROR"):
-                    pos = s.find(junk)
-                    if pos != -1:
-                        line = s[:pos].strip()
+            line_end = raw_response.find("\n", start)
+            line = raw_response[start:line_end if line_end != -1 else len(raw_response)].rstrip("\r")
+            s = line.strip()
+
+            if s == "+RECV=OK" or raw_response[raw_response.rfind("\n", 0, start) + 1:start].strip():
+                end = start
+                continue
 
-            filtered_data = line
+            for junk in ("+RECV=OK", "The list is empty!", "+RECV:NO DATA", "OK", "ERROR"):
+                pos = s.find(junk)
+                if pos != -1:
+                    line = s[:pos].strip()
 
-        return filtered_data
+            return line
 
     def set_lora_mode(self, mode: str):
         if mode not in self._VALID_LORA_MODES:
-            raise ValueError(f"Invalid LoRa mode. Allowed modes: {self._VALID_LORA_MODES}")
+            raise ValueError(f"Invalid LoRa mode. Allowed modes: {sorted(self._VALID_LORA_MODES)}")
 
-        self._mode = mode.upper()
-        self._send_command(f'LORAMODE={mode.upper()}')
+        if self._cache.get(b'LORAMODE=') != mode.encode():
+            self._forget_radio_settings()
+
+        self._mode = mode
+        self._set(b'LORAMODE=', mode.encode())
 
     def set_region(self, value: str = 'EU868'):
         if value not in self._VALID_REGIONS:
-            raise ValueError(f"Invalid region. Allowed regions: {self._VALID_REGIONS}")
+            raise ValueError(f"Invalid region. Allowed regions: {sorted(self._VALID_REGIONS)}")
+
+        if self._cache.get(b'REGION=') != value.encode():
+            self._forget_radio_settings()
 
-        self._region = str(value)
-        self._send_command(f'REGION={self._region}')
+        self._region = value
+        self._set(b'REGION=', value.encode())
 
     def set_frequency(self, value: int):
         self._required_region()
@@ -141,25 +253,25 @@ class NodeModuleDriver:
             raise ValueError(f"Frequency {value} out of range for region {self._region}. "
                              f"Valid range: {min_freq} - {max_freq} Hz")
 
-        self._send_command(f'FREQS={value}')
+        self._set(b'FREQS=', b'%d' % value)
 
     def set_transmit_power(self, value: int):
         if value not in self._VALID_TRANSMIT_POWERS:
-            raise ValueError(f"Invalid transmit power. Allowed values: {self._VALID_TRANSMIT_POWERS}")
+            raise ValueError(f"Invalid transmit power. Allowed values: {sorted(self._VALID_TRANSMIT_POWERS)}")
 
-        self._send_command(f'EIRP={value}')
+        self._set(b'EIRP=', b'%d' % value)
 
     def set_bandwidth(self, value: int) -> None:
         if value not in self._VALID_BANDWIDTHS:
-            raise ValueError(f"Invalid bandwidth. Allowed: {self._VALID_BANDWIDTHS}")
+            raise ValueError(f"Invalid bandwidth. Allowed: {sorted(self._VALID_BANDWIDTHS)}")
 
-        self._send_command(f'BW={value}')
+        self._set(b'BW=', b'%d' % value)
 
     def set_spreading_factor(self, value: int) -> None:
         if value not in self._VALID_SPREADING_FACTORS:
-            raise ValueError(f"Invalid SF. Allowed: {list(self._VALID_SPREADING_FACTORS)}")
+            raise ValueError(f"Invalid SF. Allowed: {sorted(self._VALID_SPREADING_FACTORS)}")
 
-        self._send_command(f'SF={value}')
+        self._set(b'SF=', b'%d' % value)
 
     def set_data_rate(self, value: int):
         self._required_lora_mode('LORAWAN')
@@ -168,7 +280,7 @@ class NodeModuleDriver:
         if value not in self._VALID_DATA_RANGES[self._region]:
             raise ValueError(f"Invalid data rate for region {self._region}.")
 
-        self._send_command(f'+DATARATE={value}')
+        self._set(b'DATARATE=', b'%d' % value)
 
     def set_dev_type(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -178,7 +290,7 @@ class NodeModuleDriver:
         if class_type not in self._VALID_NET_TYPES:
             raise ValueError("Device class must be CLASS_A or CLASS_C")
 
-        self._send_command(f'CLASS={class_type}')
+        self._set(b'CLASS=', class_type.encode())
 
     def set_sub_band(self, value: int):
         self._required_lora_mode('LORAWAN')
@@ -186,10 +298,10 @@ class NodeModuleDriver:
         if self._region not in {'US915', 'CN470'}:
             raise ValueError("Sub-band selection is only available for US915 and CN470 regions")
 
-        if not (0 <= value <= 15):
+        if not (0 <= value <= _MAX_SUB_BAND):
             raise ValueError("Sub-band must be between 0 and 15")
 
-        self._send_command(f'SUBBAND={value}')
+        self._set(b'SUBBAND=', b'%d' % value)
 
     def set_packet_type(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -199,7 +311,7 @@ class NodeModuleDriver:
         if mode not in self._VALID_PACKET_TYPES:
             raise ValueError("Packet type must be either CONFIRMED or UNCONFIRMED")
 
-        self._send_command(f'UPLINKTYPE={mode}')
+        self._set(b'UPLINKTYPE=', mode.encode())
 
     def set_join_type(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -210,7 +322,7 @@ class NodeModuleDriver:
             raise ValueError("Join type must be either OTAA or ABP")
 
         self._join_type = join_type
-        self._send_command(f'JOINTYPE={join_type}')
+        self._set(b'JOINTYPE=', join_type.encode())
 
     def set_app_eui(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -218,10 +330,9 @@ class NodeModuleDriver:
 
         app_eui = value.upper()
 
-        if len(app_eui) != 16:
-            raise ValueError("AppEUI must be 16 characters (8 bytes in hex)")
+        self._check_hex(app_eui, 16, "AppEUI must be 16 hexadecimal characters (8 bytes)")
 
-        self._send_command(f'JOINEUI={app_eui}')
+        self._set(b'JOINEUI=', app_eui.encode())
 
     def set_app_key(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -229,10 +340,9 @@ class NodeModuleDriver:
 
         app_key = value.upper()
 
-        if len(app_key) != 32:
-            raise ValueError("AppKey must be 32 characters (16 bytes in hex)")
+        self._check_hex(app_key, 32, "AppKey must be 32 hexadecimal characters (16 bytes)")
 
-        self._send_command(f'APPKEY={app_key}')
+        self._set(b'APPKEY=', app_key.encode())
 
     def set_dev_addr(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -240,10 +350,9 @@ class NodeModuleDriver:
 
         dev_addr = value.upper()
 
-        if len(dev_addr) != 8 or not all(c in '0123456789ABCDEF' for c in dev_addr):
-            raise ValueError("DevAddr must be 8 hex characters (0–9, A–F)")
+        self._check_hex(dev_addr, 8, "DevAddr must be 8 hex characters (0–9, A–F)")
 
-        self._send_command(f'DEVADDR={dev_addr}')
+        self._set(b'DEVADDR=', dev_addr.encode())
 
     def set_app_skey(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -251,10 +360,9 @@ class NodeModuleDriver:
 
         app_skey = value.upper()
 
-        if len(app_skey) != 32:
-            raise ValueError("AppSKey must be 32 characters (16 bytes in hex)")
+        self._check_hex(app_skey, 32, "AppSKey must be 32 hexadecimal characters (16 bytes)")
 
-        self._send_command(f'APPSKEY={app_skey}')
+        self._set(b'APPSKEY=', app_skey.encode())
 
     def set_nwk_skey(self, value: str):
         self._required_lora_mode('LORAWAN')
@@ -262,83 +370,56 @@ class NodeModuleDriver:
 
         nwk_skey = value.upper()
 
-        if len(nwk_skey) != 32:
-            raise ValueError("NwkSKey must be 32 characters (16 bytes in hex)")
+        self._check_hex(nwk_skey, 32, "NwkSKey must be 32 hexadecimal characters (16 bytes)")
 
-        self._send_command(f'NWKSKEY={nwk_skey}')
+        self._set(b'NWKSKEY=', nwk_skey.encode())
 
     def enable_adr(self, value: bool):
         self._required_lora_mode('LORAWAN')
 
-        cmd = f'ADR={1 if value else 0}'
-        self._send_command(cmd)
+        self._set(b'ADR=', b'1' if value else b'0')
 
     def enable_receive_mode(self):
-        self._send_command('RECV=1')
+        self._at_plus(b'RECV=1')
 
     def test_device(self):
-        print(self._send_command(''))
+        print(self._at_probe())
 
     def reset_device(self):
-        self._send_command('REBOOT')
+        self._cache.clear()
+        self._at_plus(b'REBOOT')
 
-    def start_device(self) -> None:
-        self._send_command('JOIN=1')
+    def wait_ready(self, timeout: float = 2.0, interval: float = 0.05):
+        deadline = ticks_add(ticks_ms(), int(timeout * _MS_PER_S))
 
-    def get_lora_mode(self):
-        response = self._send_command('LORAMODE?')
-        return response.split('=')[-1] if response else None
+        while ticks_diff(deadline, ticks_ms()) > 0:
+            ok, _ = self._exchange(self._AT_PROBE, interval)
 
-    def get_region(self):
-        response = self._send_command('REGION?')
-        return response.split('=')[-1] if response else None
+            if ok:
+                return True
 
-    def get_frequency(self):
-        response = self._send_command('FREQS?')
-        return response.split('=')[-1] if response else None
+        return False
 
-    def get_transmit_power(self):
-        response = self._send_command('EIRP?')
-        return response.split('=')[-1] if response else None
-
-    def get_bandwidth(self):
-        response = self._send_command('BW?')
-        return response.split('=')[-1] if response else None
-
-    def get_spreading_factor(self):
-        response = self._send_command('SF?')
-        return response.split('=')[-1] if response else None
-
-    def get_data_rate(self):
-        response = self._send_command('DATARATE?')
-        return response.split('=')[-1] if response else None
-
-    def get_dev_eui(self):
-        response = self._send_command('DEVEUI?')
-        return response.split('=')[-1] if response else None
-
-    def get_net_id(self):
-        response = self._send_command('NETID?')
-        return response.split('=')[-1] if response else None
-
-    def get_dev_addr(self):
-        response = self._send_command('DEVADDR?')
-        return response.split('=')[-1] if response else None
+    def start_device(self) -> None:
+        self._cache.clear()
+        self._at_plus(b'JOIN=1')
 
-    def get_eirp(self):
-        response = self._send_command('EIRP?')
-        return response.split('=')[-1] if response else None
+    @property
+    def uart(self):
+        return self._uart
 
     def is_joined(self):
         self._required_lora_mode('LORAWAN')
 
-        response = self._send_command('JOIN?')
-        joined = response and response.strip() == '+JOIN=1'
+        ok, response = self._exchange(self._AT_PLUS + b'JOIN?' + self._CRLF)
+
+        if not response or ok is False:
+            return False
 
-        return joined
+        return response.split('\r\n', 1)[0] == '+JOIN=1'
 
     def send_data(self, target_id: int, data: str):
-        if not (1 <= target_id <= 255):
+        if not (_MIN_ID <= target_id <= _MAX_ID):
             raise ValueError("Target ID must be between 1 and 255")
 
         if target_id == self._device_id:
@@ -351,12 +432,9 @@ class NodeModuleDriver:
             if self._join_type is None:
                 raise ValueError("Join type must be set before sending data in LoRaWAN mode")
 
-        to_hex = f'{target_id:02X}'
-        from_hex = f'{self._device_id:02X}'
-        data_hex = data.encode().hex().upper()
-        payload = to_hex + from_hex + data_hex
+        payload = hexlify(pack('BB', target_id, self._device_id) + data.encode()).upper()
 
-        self._send_command(f'SEND={payload}')
+        self._send_raw(self._SEND_PREFIX + payload + self._CRLF)
 
     def receive_specific_data(self):
         value = None
@@ -371,10 +449,11 @@ class NodeModuleDriver:
         if len(data_bytes) < 2:
             return None
 
-        to_id = data_bytes[0]
+        to_id, _ = unpack_from('BB', data_bytes)
+        view = memoryview(data_bytes)
         tab_idx = data_bytes.find(b"\t")
-        payload_bytes = data_bytes[tab_idx + 1:] if tab_idx != -1 else data_bytes[2:]
-        payload = payload_bytes.decode("utf-8")
+        payload_bytes = view[tab_idx + 1:] if tab_idx != -1 else view[2:]
+        payload = bytes(payload_bytes).decode("utf-8")
 
         if to_id == self._device_id:
             value = payload
@@ -389,14 +468,22 @@ class NodeModuleDriver:
             return None
 
         if response.startswith("+RECV="):
-            parts = response.split("\t", 1)
+            tab_idx = response.find("\t")
 
-            if len(parts) == 2:
-                value = parts[1]
+            if tab_idx != -1:
+                value = response[tab_idx + 1:]
             else:
-                value = response.split(" ", 1)[-1]
+                value = response[response.find(" ") + 1:]
 
         if value:
             return value
         else:
             return None
+
+
+for _name, _command in NodeModuleDriver._QUERIES.items():
+    setattr(NodeModuleDriver, 'get_' + _name, (lambda command: lambda self: self._query(command))(_command))
+
+NodeModuleDriver.get_eirp = NodeModuleDriver.get_transmit_power
+
+del _name, _command
@@ -1,8 +1,12 @@
 import ast
+import inspect
+import io
 import re
 import sys
-import textwrap
-from typing import List
+from typing import TextIO
+
+
+FIELD_LINE_RE = re.compile(r"^\s*:")
 
 
 def is_public(name: str) -> bool:
@@ -13,51 +17,52 @@ def clean_docstring(doc: str) -> str:
     if not doc:
         return ""
 
-    lines = doc.splitlines()
-    filtered = []
+    return "\n".join(line for line in doc.splitlines() if not FIELD_LINE_RE.match(line)).strip()
 
-    for line in lines:
-        if re.match(r"^\s*:", line):
-            continue
 
-        filtered.append(line)
+def get_docstring(node: ast.AST) -> str:
+    first = node.body[0] if node.body else None
 
-    return "\n".join(filtered).strip()
+    if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str):
+        return inspect.cleandoc(first.value.value)
 
+    return ""
 
-def generate_markdown(source_path: str) -> str:
+
+def write_markdown(source_path: str, out: TextIO) -> None:
     with open(source_path, "r", encoding="utf-8") as f:
         tree = ast.parse(f.read(), filename=source_path)
 
-    lines: List[str] = []
+    out.write("# API\n")
 
-    lines.append("# API")
-    lines.append("")
+    for cls in tree.body:
+        if not isinstance(cls, ast.ClassDef) or not is_public(cls.name):
+            continue
+
+        out.write(f"\n## {cls.name}\n")
 
-    classes: List[ast.ClassDef] = [
-        n for n in tree.body if isinstance(n, ast.ClassDef) and is_public(n.name)
-    ]
+        for m in cls.body:
+            if type(m) is ast.FunctionDef:
+                prefix = ""
+            elif type(m) is ast.AsyncFunctionDef:
+                prefix = "async "
+            else:
+                continue
 
-    for cls in classes:
-        lines.append(f"## {cls.name}")
-        lines.append("")
+            if not is_public(m.name):
+                continue
 
-        methods = [
-            n for n in cls.body
-            if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)) and is_public(n.name)
-        ]
+            out.write(f"\n### {prefix}{m.name}\n\n")
+            mdoc = clean_docstring(get_docstring(m))
+            out.write(mdoc if mdoc else "_No Description._")
+            out.write("\n")
 
-        if methods:
-            for m in methods:
-                prefix = "async " if isinstance(m, ast.AsyncFunctionDef) else ""
-                lines.append(f"### {prefix}{m.name}")
-                lines.append("")
-                raw_doc = ast.get_docstring(m) or "_No Description._"
-                mdoc = clean_docstring(textwrap.dedent(raw_doc))
-                lines.append(mdoc if mdoc else "_No Description._")
-                lines.append("")
 
-    return "\n".join(lines)
+def generate_markdown(source_path: str) -> str:
+    out = io.StringIO()
+    write_markdown(source_path, out)
+
+    return out.getvalue()
 
 
 def main():
@@ -68,9 +73,8 @@ def main():
     source_path = sys.argv[1]
     output_path = sys.argv[2] if len(sys.argv) > 2 else "readme_api.md"
 
-    md = generate_markdown(source_path)
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(md)
+        write_markdown(source_path, f)
 
     print(f"API-Document generated: {output_path}")
 